@@ -2,15 +2,20 @@
 import argparse
 import sqlite3
 
+from import_verbs import NORM_VERSION, normalize
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Sanity-check forms in the SQLite DB.")
     parser.add_argument("--db", default="ag_db.sqlite", help="SQLite DB path (default: ag_db.sqlite)")
-    parser.add_argument("--form", required=True, help="Exact form string to look up")
+    parser.add_argument("--form", required=True, help="Form to look up (matched case- and normalization-insensitively)")
     args = parser.parse_args()
 
     conn = sqlite3.connect(args.db)
     try:
+        if conn.execute("PRAGMA user_version").fetchone()[0] < NORM_VERSION:
+            print("form_norm predates the current normalization; re-run import_verbs.py on this DB first.")
+            return 1
         sql = """
         SELECT lemma.headword,
                pos.code,
@@ -30,10 +35,10 @@ def main() -> int:
         JOIN lemma ON form.lemma_id = lemma.id
         JOIN pos ON form.pos_id = pos.id
         LEFT JOIN dialect ON form.dialect_id = dialect.id
-        WHERE form.form = ?
+        WHERE form.form_norm = ?
         ORDER BY lemma.headword, pos.code, form.id;
         """
-        rows = conn.execute(sql, (args.form,)).fetchall()
+        rows = conn.execute(sql, (normalize(args.form),)).fetchall()
         if not rows:
             print("No rows found.")
             return 1
@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
 import argparse
+import concurrent.futures
+import functools
 import json
 import os
 import re
 import sqlite3
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import deque
+from typing import BinaryIO, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from unicodedata import normalize as unicode_normalize
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-SCHEMA_SQL = """
+
+SCHEMA_TABLES_SQL = """
 PRAGMA foreign_keys = ON;
 
 CREATE TABLE IF NOT EXISTS lemma (
@@ -88,10 +97,77 @@ CREATE TABLE IF NOT EXISTS form (
 );
 
 CREATE INDEX IF NOT EXISTS idx_lemma_headword_norm ON lemma(headword_norm);
-CREATE INDEX IF NOT EXISTS idx_form_form_norm ON form(form_norm);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_lemma_headword_unique ON lemma(headword, headword_norm);
+"""
+
+SCHEMA_INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_form_form_norm_cover ON form(form_norm, lemma_id, pos_id, dialect_id);
 CREATE INDEX IF NOT EXISTS idx_form_lemma_pos ON form(lemma_id, pos_id);
 CREATE INDEX IF NOT EXISTS idx_form_features_verb ON form(pos_id, tense, mood, voice, person, number);
 CREATE INDEX IF NOT EXISTS idx_form_features_nominal ON form(pos_id, grammatical_case, gender, number);
+CREATE INDEX IF NOT EXISTS idx_form_dialect_id ON form(dialect_id);
+CREATE INDEX IF NOT EXISTS idx_sense_lemma_id ON sense(lemma_id);
+"""
+
+DROP_INDEXES_SQL = """
+DROP INDEX IF EXISTS idx_form_form_norm;
+DROP INDEX IF EXISTS idx_form_form_norm_cover;
+DROP INDEX IF EXISTS idx_form_lemma_pos;
+DROP INDEX IF EXISTS idx_form_features_verb;
+DROP INDEX IF EXISTS idx_form_features_nominal;
+DROP INDEX IF EXISTS idx_form_dialect_id;
+DROP INDEX IF EXISTS idx_sense_lemma_id;
+"""
+
+NORM_VERSION = 1
+
+LEMMA_POS_INSERT_SQL = "INSERT OR IGNORE INTO lemma_pos (lemma_id, pos_id, is_primary) VALUES (?, ?, ?)"
+
+SENSE_INSERT_SQL = """
+INSERT INTO sense (
+    lemma_id, pos_id, gloss, definition, sense_order,
+    tags, form_of, alt_of, qualifier, categories,
+    raw_glosses, raw_tags, links, topics, examples, sense_extra
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+FORM_INSERT_SQL = """
+INSERT INTO form (
+    lemma_id, pos_id, form, form_norm, dialect_id,
+    tense, mood, voice, person, number,
+    grammatical_case, gender, degree,
+    verb_form_type, is_principal_part,
+    pronoun_type, governs_case, tags, source
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def json_each_select(column_count: int) -> str:
+    columns = ", ".join(f"json_extract(value, '$[{i}]')" for i in range(column_count))
+    return f"SELECT {columns} FROM json_each(?)"
+
+
+LEMMA_POS_JSON_INSERT_SQL = f"""
+INSERT OR IGNORE INTO lemma_pos (lemma_id, pos_id, is_primary)
+{json_each_select(3)}
+"""
+
+SENSE_JSON_INSERT_SQL = f"""
+INSERT INTO sense (
+    lemma_id, pos_id, gloss, definition, sense_order,
+    tags, form_of, alt_of, qualifier, categories,
+    raw_glosses, raw_tags, links, topics, examples, sense_extra
+) {json_each_select(16)}
+"""
+
+FORM_JSON_INSERT_SQL = f"""
+INSERT INTO form (
+    lemma_id, pos_id, form, form_norm, dialect_id,
+    tense, mood, voice, person, number,
+    grammatical_case, gender, degree,
+    verb_form_type, is_principal_part,
+    pronoun_type, governs_case, tags, source
+) {json_each_select(19)}
 """
 
 
@@ -179,6 +255,27 @@ VERB_FORM_TAGS = {
     "participle": "participle",
 }
 
+TAG_FIELDS = (
+    ("dialect", DIALECT_TAGS),
+    ("case", CASE_TAGS),
+    ("number", NUMBER_TAGS),
+    ("gender", GENDER_TAGS),
+    ("person", PERSON_TAGS),
+    ("tense", TENSE_TAGS),
+    ("mood", MOOD_TAGS),
+    ("voice", VOICE_TAGS),
+    ("degree", DEGREE_TAGS),
+    ("verb_form_type", VERB_FORM_TAGS),
+)
+
+TAG_FIELD_NAMES = tuple(field for field, _ in TAG_FIELDS)
+
+TAG_TO_FIELD: Dict[str, Tuple[str, str, int]] = {
+    tag: (field, value, rank)
+    for field, mapping in TAG_FIELDS
+    for rank, (tag, value) in enumerate(mapping.items())
+}
+
 PRONOUN_TYPE_KEYWORDS = [
     "personal",
     "demonstrative",
@@ -193,6 +290,19 @@ PRONOUN_TYPE_KEYWORDS = [
     "distal",
 ]
 
+REJECTED_FORM_TAGS = frozenset(["romanization", "inflection-template", "table-tags", "class"])
+
+GOVERNED_CASE_ALIASES = {
+    "gen": "genitive",
+    "genitive": "genitive",
+    "dat": "dative",
+    "dative": "dative",
+    "acc": "accusative",
+    "accusative": "accusative",
+}
+
+CASE_SPLIT_RE = re.compile(r"[;,/]")
+
 POS_ALIASES = {
     "adjective": "adj",
     "adj": "adj",
@@ -285,8 +395,26 @@ SENSE_EXTRA_KEYS = {
 }
 
 
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def json_dumps(value) -> str:
+        return orjson.dumps(value).decode("utf-8")
+
+else:
+    json_loads = json.loads
+
+    def json_dumps(value) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=65536)
+def dump_tags(tags: Tuple[str, ...]) -> str:
+    return json_dumps(tags)
+
+
 def normalize(text: str) -> str:
-    return text.lower()
+    return unicode_normalize("NFC", unicode_normalize("NFC", text).casefold())
 
 
 def dumps_or_none(value) -> Optional[str]:
@@ -295,7 +423,7 @@ def dumps_or_none(value) -> Optional[str]:
     if isinstance(value, (list, dict)):
         if not value:
             return None
-        return json.dumps(value, ensure_ascii=True)
+        return json_dumps(value)
     if isinstance(value, str) and not value:
         return None
     return value
@@ -314,27 +442,18 @@ def ensure_schema_columns(conn: sqlite3.Connection) -> None:
     ensure_columns(conn, "form", FORM_EXTRA_COLUMNS)
 
 
-def parse_tags(tags: Iterable[str]) -> Dict[str, Optional[str]]:
-    tags_lc = {t.lower() for t in tags}
-
-    def pick(mapping: Dict[str, str]) -> Optional[str]:
-        for key, value in mapping.items():
-            if key in tags_lc:
-                return value
-        return None
-
-    return {
-        "dialect": pick(DIALECT_TAGS),
-        "case": pick(CASE_TAGS),
-        "number": pick(NUMBER_TAGS),
-        "gender": pick(GENDER_TAGS),
-        "person": pick(PERSON_TAGS),
-        "tense": pick(TENSE_TAGS),
-        "mood": pick(MOOD_TAGS),
-        "voice": pick(VOICE_TAGS),
-        "degree": pick(DEGREE_TAGS),
-        "verb_form_type": pick(VERB_FORM_TAGS),
-    }
+def parse_tags_lc(tags_lc: Iterable[str]) -> Dict[str, Optional[str]]:
+    out: Dict[str, Optional[str]] = dict.fromkeys(TAG_FIELD_NAMES)
+    ranks: Dict[str, int] = {}
+    for tag in tags_lc:
+        hit = TAG_TO_FIELD.get(tag)
+        if hit is None:
+            continue
+        field, value, rank = hit
+        if field not in ranks or rank < ranks[field]:
+            ranks[field] = rank
+            out[field] = value
+    return out
 
 
 def parse_dialect_from_label(label: str) -> Optional[str]:
@@ -408,19 +527,14 @@ def parse_table_features(label: str) -> Dict[str, Optional[str]]:
     return features
 
 
-def should_keep_form(form_entry: Dict) -> bool:
-    if not form_entry.get("form"):
-        return False
-    if form_entry.get("form") == "-":
-        return False
-    tags = [t.lower() for t in form_entry.get("tags", [])]
-    if not tags:
-        return False
-    if "romanization" in tags:
-        return False
-    if "inflection-template" in tags or "table-tags" in tags or "class" in tags:
-        return False
-    return True
+def should_keep_form_lc(form_entry: Dict) -> Optional[List[str]]:
+    form = form_entry.get("form")
+    if not form or form == "-":
+        return None
+    tags_lc = [t.lower() for t in form_entry.get("tags") or []]
+    if not tags_lc or not REJECTED_FORM_TAGS.isdisjoint(tags_lc):
+        return None
+    return tags_lc
 
 
 def extract_pronoun_type(entry: Dict) -> Optional[str]:
@@ -446,35 +560,23 @@ def extract_pronoun_type(entry: Dict) -> Optional[str]:
 def extract_governs_case(entry: Dict) -> Optional[str]:
     cases: List[str] = []
 
-    def add_case(raw: str) -> None:
-        raw = raw.strip().lower()
-        mapping = {
-            "gen": "genitive",
-            "genitive": "genitive",
-            "dat": "dative",
-            "dative": "dative",
-            "acc": "accusative",
-            "accusative": "accusative",
-        }
-        if raw in mapping:
-            case = mapping[raw]
-            if case not in cases:
-                cases.append(case)
-
     for sense in entry.get("senses") or []:
         for tag in sense.get("tags") or []:
             tag_lc = str(tag).lower()
             if tag_lc.startswith("with-"):
-                add_case(tag_lc.replace("with-", ""))
+                case = GOVERNED_CASE_ALIASES.get(tag_lc[5:].strip())
+                if case and case not in cases:
+                    cases.append(case)
 
     for head in entry.get("head_templates") or []:
         args = head.get("args") or {}
         value = args.get("2")
         if not isinstance(value, str):
             continue
-        parts = value.replace(";", "/").replace(",", "/").split("/")
-        for part in parts:
-            add_case(part)
+        for part in CASE_SPLIT_RE.split(value):
+            case = GOVERNED_CASE_ALIASES.get(part.strip().lower())
+            if case and case not in cases:
+                cases.append(case)
 
     if not cases:
         return None
@@ -484,52 +586,68 @@ def extract_governs_case(entry: Dict) -> Optional[str]:
 def ensure_pos(conn: sqlite3.Connection, code: str, pos_cache: Dict[str, int]) -> int:
     if code in pos_cache:
         return pos_cache[code]
-    cur = conn.execute("SELECT id FROM pos WHERE code = ?", (code,))
-    row = cur.fetchone()
-    if row:
-        pos_cache[code] = row[0]
-        return row[0]
-    cur = conn.execute("INSERT INTO pos (code) VALUES (?)", (code,))
-    pos_cache[code] = cur.lastrowid
-    return cur.lastrowid
+    cur = conn.execute(
+        "INSERT INTO pos (code) VALUES (?) ON CONFLICT(code) DO UPDATE SET code = excluded.code RETURNING id",
+        (code,),
+    )
+    pos_id = cur.fetchone()[0]
+    pos_cache[code] = pos_id
+    return pos_id
 
 
 def ensure_dialect(conn: sqlite3.Connection, code: str, dialect_cache: Dict[str, int]) -> int:
     if code in dialect_cache:
         return dialect_cache[code]
-    cur = conn.execute("SELECT id FROM dialect WHERE code = ?", (code,))
-    row = cur.fetchone()
-    if row:
-        dialect_cache[code] = row[0]
-        return row[0]
-    cur = conn.execute("INSERT INTO dialect (code) VALUES (?)", (code,))
-    dialect_cache[code] = cur.lastrowid
-    return cur.lastrowid
+    cur = conn.execute(
+        "INSERT INTO dialect (code) VALUES (?) ON CONFLICT(code) DO UPDATE SET code = excluded.code RETURNING id",
+        (code,),
+    )
+    dialect_id = cur.fetchone()[0]
+    dialect_cache[code] = dialect_id
+    return dialect_id
 
 
 def ensure_lemma(
     conn: sqlite3.Connection,
     headword: str,
+    metadata: Tuple[Optional[object], ...],
     lemma_cache: Dict[Tuple[str, str], int],
+    last_lemma_meta: Dict[int, Tuple[Optional[object], ...]],
 ) -> int:
     headword_norm = normalize(headword)
     key = (headword, headword_norm)
-    if key in lemma_cache:
-        return lemma_cache[key]
-    cur = conn.execute(
-        "SELECT id FROM lemma WHERE headword = ? AND headword_norm = ?",
-        (headword, headword_norm),
-    )
-    row = cur.fetchone()
-    if row:
-        lemma_cache[key] = row[0]
-        return row[0]
+    has_metadata = any(value is not None for value in metadata)
+    lemma_id = lemma_cache.get(key)
+    if lemma_id is not None and (not has_metadata or last_lemma_meta.get(lemma_id) == metadata):
+        return lemma_id
     cur = conn.execute(
-        "INSERT INTO lemma (headword, headword_norm) VALUES (?, ?)",
-        (headword, headword_norm),
+        """
+        INSERT INTO lemma (
+            headword, headword_norm,
+            etymology_text, etymology_templates, etymology_number,
+            inflection_templates, related, synonyms, antonyms,
+            categories, entry_extra
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(headword, headword_norm) DO UPDATE SET
+            etymology_text = COALESCE(excluded.etymology_text, lemma.etymology_text),
+            etymology_templates = COALESCE(excluded.etymology_templates, lemma.etymology_templates),
+            etymology_number = COALESCE(excluded.etymology_number, lemma.etymology_number),
+            inflection_templates = COALESCE(excluded.inflection_templates, lemma.inflection_templates),
+            related = COALESCE(excluded.related, lemma.related),
+            synonyms = COALESCE(excluded.synonyms, lemma.synonyms),
+            antonyms = COALESCE(excluded.antonyms, lemma.antonyms),
+            categories = COALESCE(excluded.categories, lemma.categories),
+            entry_extra = COALESCE(excluded.entry_extra, lemma.entry_extra)
+        RETURNING id
+        """,
+        (headword, headword_norm) + metadata,
     )
-    lemma_cache[key] = cur.lastrowid
-    return cur.lastrowid
+    lemma_id = cur.fetchone()[0]
+    lemma_cache[key] = lemma_id
+    if has_metadata:
+        last_lemma_meta.clear()
+        last_lemma_meta[lemma_id] = metadata
+    return lemma_id
 
 
 def extract_gloss(sense: Dict) -> Tuple[str, Optional[str]]:
@@ -541,106 +659,217 @@ def extract_gloss(sense: Dict) -> Tuple[str, Optional[str]]:
     return gloss, definition
 
 
-def extract_entry_metadata(entry: Dict) -> Dict[str, Optional[object]]:
-    etymology_text = entry.get("etymology_text")
-    etymology_templates = dumps_or_none(entry.get("etymology_templates"))
-    etymology_number = entry.get("etymology_number")
-    inflection_templates = dumps_or_none(entry.get("inflection_templates"))
-    related = dumps_or_none(entry.get("related"))
-    synonyms = dumps_or_none(entry.get("synonyms"))
-    antonyms = dumps_or_none(entry.get("antonyms"))
-    categories = dumps_or_none(entry.get("categories"))
-
-    extra = {k: v for k, v in entry.items() if k not in ENTRY_EXTRA_KEYS}
-    entry_extra = dumps_or_none(extra)
-
-    return {
-        "etymology_text": etymology_text,
-        "etymology_templates": etymology_templates,
-        "etymology_number": etymology_number,
-        "inflection_templates": inflection_templates,
-        "related": related,
-        "synonyms": synonyms,
-        "antonyms": antonyms,
-        "categories": categories,
-        "entry_extra": entry_extra,
-    }
+def extract_entry_metadata(entry: Dict, keep_extra: bool = False) -> Tuple[Optional[object], ...]:
+    entry_extra = None
+    if keep_extra:
+        entry_extra = dumps_or_none({k: v for k, v in entry.items() if k not in ENTRY_EXTRA_KEYS})
+    return (
+        entry.get("etymology_text"),
+        dumps_or_none(entry.get("etymology_templates")),
+        entry.get("etymology_number"),
+        dumps_or_none(entry.get("inflection_templates")),
+        dumps_or_none(entry.get("related")),
+        dumps_or_none(entry.get("synonyms")),
+        dumps_or_none(entry.get("antonyms")),
+        dumps_or_none(entry.get("categories")),
+        entry_extra,
+    )
+
+
+def extract_sense_metadata(sense: Dict, keep_extra: bool = False) -> Tuple[Optional[str], ...]:
+    qualifier = sense.get("qualifier")
+    sense_extra = None
+    if keep_extra:
+        sense_extra = dumps_or_none({k: v for k, v in sense.items() if k not in SENSE_EXTRA_KEYS})
+    return (
+        dumps_or_none(sense.get("tags")),
+        dumps_or_none(sense.get("form_of")),
+        dumps_or_none(sense.get("alt_of")),
+        qualifier if isinstance(qualifier, str) else None,
+        dumps_or_none(sense.get("categories")),
+        dumps_or_none(sense.get("raw_glosses")),
+        dumps_or_none(sense.get("raw_tags")),
+        dumps_or_none(sense.get("links")),
+        dumps_or_none(sense.get("topics")),
+        dumps_or_none(sense.get("examples")),
+        sense_extra,
+    )
+
+
+def flush_rows(
+    cursors: Tuple[sqlite3.Cursor, sqlite3.Cursor, sqlite3.Cursor],
+    lemma_pos_rows: List[tuple],
+    sense_rows: List[tuple],
+    form_rows: List[tuple],
+    use_json_each: bool = False,
+) -> None:
+    lemma_pos_cur, sense_cur, form_cur = cursors
+    batches = (
+        (lemma_pos_cur, lemma_pos_rows, LEMMA_POS_INSERT_SQL, LEMMA_POS_JSON_INSERT_SQL),
+        (sense_cur, sense_rows, SENSE_INSERT_SQL, SENSE_JSON_INSERT_SQL),
+        (form_cur, form_rows, FORM_INSERT_SQL, FORM_JSON_INSERT_SQL),
+    )
+    for cur, rows, insert_sql, json_insert_sql in batches:
+        if not rows:
+            continue
+        if use_json_each:
+            cur.execute(json_insert_sql, (json_dumps(rows),))
+        else:
+            cur.executemany(insert_sql, rows)
+        rows.clear()
+
 
+ParsedEntry = Tuple[str, str, Tuple[Optional[object], ...], List[tuple], List[tuple]]
+ChunkResult = Tuple[List[ParsedEntry], Dict[str, int], Dict[str, int]]
 
-def extract_sense_metadata(sense: Dict) -> Dict[str, Optional[str]]:
-    tags = dumps_or_none(sense.get("tags"))
-    form_of = dumps_or_none(sense.get("form_of"))
-    alt_of = dumps_or_none(sense.get("alt_of"))
-    qualifier = sense.get("qualifier") if isinstance(sense.get("qualifier"), str) else None
-    categories = dumps_or_none(sense.get("categories"))
-    raw_glosses = dumps_or_none(sense.get("raw_glosses"))
-    raw_tags = dumps_or_none(sense.get("raw_tags"))
-    links = dumps_or_none(sense.get("links"))
-    topics = dumps_or_none(sense.get("topics"))
-    examples = dumps_or_none(sense.get("examples"))
-
-    extra = {k: v for k, v in sense.items() if k not in SENSE_EXTRA_KEYS}
-    sense_extra = dumps_or_none(extra)
-
-    return {
-        "tags": tags,
-        "form_of": form_of,
-        "alt_of": alt_of,
-        "qualifier": qualifier,
-        "categories": categories,
-        "raw_glosses": raw_glosses,
-        "raw_tags": raw_tags,
-        "links": links,
-        "topics": topics,
-        "examples": examples,
-        "sense_extra": sense_extra,
+
+def iter_chunks(handle: BinaryIO, chunk_size: int) -> Iterator[List[bytes]]:
+    chunk: List[bytes] = []
+    for line in handle:
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parse_entry(entry: Dict, pos_code: str, headword: str, keep_extra: bool = False) -> ParsedEntry:
+    entry_metadata = extract_entry_metadata(entry, keep_extra)
+    pronoun_type = extract_pronoun_type(entry) if pos_code == "pron" else None
+    governs_case = extract_governs_case(entry) if pos_code == "prep" else None
+
+    senses: List[tuple] = []
+    for idx, sense in enumerate(entry.get("senses") or []):
+        gloss, definition = extract_gloss(sense)
+        senses.append((gloss, definition, idx) + extract_sense_metadata(sense, keep_extra))
+
+    forms: List[tuple] = []
+    current_table_features = {
+        "dialect": None,
+        "tense": None,
+        "mood": None,
+        "voice": None,
+        "verb_form_type": None,
     }
+    for form_entry in entry.get("forms") or []:
+        tags_lc = should_keep_form_lc(form_entry)
+        if tags_lc is None:
+            if any(t.lower() == "table-tags" for t in form_entry.get("tags") or []):
+                current_table_features = parse_table_features(form_entry.get("form") or "")
+            continue
+
+        tags = form_entry["tags"]
+        form_text = form_entry["form"]
+        parsed = parse_tags_lc(tags_lc)
+        forms.append(
+            (
+                form_text,
+                normalize(form_text),
+                parsed["dialect"] or current_table_features["dialect"],
+                parsed["tense"] or current_table_features["tense"],
+                parsed["mood"] or current_table_features["mood"],
+                parsed["voice"] or current_table_features["voice"],
+                parsed["person"],
+                parsed["number"],
+                parsed["case"],
+                parsed["gender"],
+                parsed["degree"],
+                parsed["verb_form_type"] or current_table_features["verb_form_type"],
+                0,
+                pronoun_type,
+                governs_case,
+                dump_tags(tuple(tags)),
+                form_entry.get("source"),
+            )
+        )
+
+    return pos_code, headword, entry_metadata, senses, forms
+
+
+def parse_chunk(lines: List[bytes], allowed_pos: Dict[str, str], keep_extra: bool = False) -> ChunkResult:
+    parsed: List[ParsedEntry] = []
+    skipped_pos_counts: Dict[str, int] = {}
+    skipped_reasons: Dict[str, int] = {}
+
+    def skip(reason: str) -> None:
+        skipped_reasons[reason] = skipped_reasons.get(reason, 0) + 1
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            entry = json_loads(line)
+        except json.JSONDecodeError:
+            skip("json_decode_error")
+            continue
+
+        if entry.get("lang_code") != "grc":
+            skip("non_grc")
+            continue
+        raw_pos = (entry.get("pos") or "").strip()
+        if not raw_pos:
+            skip("missing_pos")
+            continue
+        pos_code = allowed_pos.get(raw_pos)
+        if pos_code is None:
+            skip("pos_not_allowed")
+            skipped_pos_counts[raw_pos] = skipped_pos_counts.get(raw_pos, 0) + 1
+            continue
+
+        headword = entry.get("word")
+        if not headword:
+            skip("missing_headword")
+            continue
+
+        parsed.append(parse_entry(entry, pos_code, headword, keep_extra))
 
+    return parsed, skipped_pos_counts, skipped_reasons
 
-def update_lemma_metadata(conn: sqlite3.Connection, lemma_id: int, metadata: Dict[str, Optional[object]]) -> None:
-    if not any(value is not None for value in metadata.values()):
+
+def parse_chunks(
+    chunks: Iterable[List[bytes]],
+    allowed_pos: Dict[str, str],
+    workers: int,
+    keep_extra: bool = False,
+) -> Iterator[ChunkResult]:
+    parse = functools.partial(parse_chunk, allowed_pos=allowed_pos, keep_extra=keep_extra)
+    if workers <= 1:
+        yield from map(parse, chunks)
         return
-    conn.execute(
-        """
-        UPDATE lemma SET
-            etymology_text = COALESCE(?, etymology_text),
-            etymology_templates = COALESCE(?, etymology_templates),
-            etymology_number = COALESCE(?, etymology_number),
-            inflection_templates = COALESCE(?, inflection_templates),
-            related = COALESCE(?, related),
-            synonyms = COALESCE(?, synonyms),
-            antonyms = COALESCE(?, antonyms),
-            categories = COALESCE(?, categories),
-            entry_extra = COALESCE(?, entry_extra)
-        WHERE id = ?
-        """,
-        (
-            metadata["etymology_text"],
-            metadata["etymology_templates"],
-            metadata["etymology_number"],
-            metadata["inflection_templates"],
-            metadata["related"],
-            metadata["synonyms"],
-            metadata["antonyms"],
-            metadata["categories"],
-            metadata["entry_extra"],
-            lemma_id,
-        ),
-    )
+    # Executor.map submits every chunk up front; keep a bounded, ordered window instead.
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[concurrent.futures.Future] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(parse, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 def import_jsonl(
     conn: sqlite3.Connection,
     jsonl_path: str,
-    allowed_pos: Set[str],
+    allowed_pos: Dict[str, str],
     commit_every: int = 1000,
+    batch_size: int = 5000,
+    workers: int = 1,
+    chunk_size: int = 10000,
+    use_json_each: bool = False,
+    keep_extra: bool = False,
 ) -> None:
     pos_cache: Dict[str, int] = {}
     dialect_cache: Dict[str, int] = {}
     lemma_cache: Dict[Tuple[str, str], int] = {}
+    last_lemma_meta: Dict[int, Tuple[Optional[object], ...]] = {}
+    lemma_pos_rows: List[tuple] = []
+    sense_rows: List[tuple] = []
+    form_rows: List[tuple] = []
+    insert_cursors = (conn.cursor(), conn.cursor(), conn.cursor())
 
     conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(DROP_INDEXES_SQL)
 
     inserted = 0
     skipped_pos_counts: Dict[str, int] = {}
@@ -651,147 +880,45 @@ def import_jsonl(
         "pos_not_allowed": 0,
         "missing_headword": 0,
     }
-    with open(jsonl_path, "r", encoding="utf-8") as handle:
-        for line_no, line in enumerate(handle, start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                skipped_reasons["json_decode_error"] += 1
-                continue
-
-            if entry.get("lang_code") != "grc":
-                skipped_reasons["non_grc"] += 1
-                continue
-            pos_code = (entry.get("pos") or "").strip()
-            if not pos_code:
-                skipped_reasons["missing_pos"] += 1
-                continue
-            if pos_code not in allowed_pos:
-                skipped_reasons["pos_not_allowed"] += 1
-                skipped_pos_counts[pos_code] = skipped_pos_counts.get(pos_code, 0) + 1
-                continue
-
-            headword = entry.get("word")
-            if not headword:
-                skipped_reasons["missing_headword"] += 1
-                continue
-
-            entry_metadata = extract_entry_metadata(entry)
-            pos_id = ensure_pos(conn, pos_code, pos_cache)
-            lemma_id = ensure_lemma(conn, headword, lemma_cache)
-            update_lemma_metadata(conn, lemma_id, entry_metadata)
-            pronoun_type = extract_pronoun_type(entry) if pos_code == "pron" else None
-            governs_case = extract_governs_case(entry) if pos_code == "prep" else None
-
-            conn.execute(
-                "INSERT OR IGNORE INTO lemma_pos (lemma_id, pos_id, is_primary) VALUES (?, ?, ?)",
-                (lemma_id, pos_id, 1),
-            )
-
-            senses = entry.get("senses") or []
-            for idx, sense in enumerate(senses):
-                gloss, definition = extract_gloss(sense)
-                sense_metadata = extract_sense_metadata(sense)
-                conn.execute(
-                    """
-                    INSERT INTO sense (
-                        lemma_id, pos_id, gloss, definition, sense_order,
-                        tags, form_of, alt_of, qualifier, categories,
-                        raw_glosses, raw_tags, links, topics, examples, sense_extra
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        lemma_id,
-                        pos_id,
-                        gloss,
-                        definition,
-                        idx,
-                        sense_metadata["tags"],
-                        sense_metadata["form_of"],
-                        sense_metadata["alt_of"],
-                        sense_metadata["qualifier"],
-                        sense_metadata["categories"],
-                        sense_metadata["raw_glosses"],
-                        sense_metadata["raw_tags"],
-                        sense_metadata["links"],
-                        sense_metadata["topics"],
-                        sense_metadata["examples"],
-                        sense_metadata["sense_extra"],
-                    ),
-                )
-
-            current_table_features = {
-                "dialect": None,
-                "tense": None,
-                "mood": None,
-                "voice": None,
-                "verb_form_type": None,
-            }
-            for form_entry in entry.get("forms") or []:
-                tags = form_entry.get("tags") or []
-                tags_lc = [t.lower() for t in tags]
-                if "table-tags" in tags_lc:
-                    current_table_features = parse_table_features(form_entry.get("form") or "")
-                    continue
-
-                if not should_keep_form(form_entry):
-                    continue
-
-                form_text = form_entry.get("form")
-                form_norm = normalize(form_text)
-                parsed = parse_tags(tags)
-
-                dialect_value = parsed["dialect"] or current_table_features["dialect"]
-                dialect_id = None
-                if dialect_value:
-                    dialect_id = ensure_dialect(conn, dialect_value, dialect_cache)
-
-                tense_value = parsed["tense"] or current_table_features["tense"]
-                mood_value = parsed["mood"] or current_table_features["mood"]
-                voice_value = parsed["voice"] or current_table_features["voice"]
-                verb_form_type_value = parsed["verb_form_type"] or current_table_features["verb_form_type"]
-
-                conn.execute(
-                    """
-                    INSERT INTO form (
-                        lemma_id, pos_id, form, form_norm, dialect_id,
-                        tense, mood, voice, person, number,
-                        grammatical_case, gender, degree,
-                        verb_form_type, is_principal_part,
-                        pronoun_type, governs_case, tags, source
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        lemma_id,
-                        pos_id,
-                        form_text,
-                        form_norm,
-                        dialect_id,
-                        tense_value,
-                        mood_value,
-                        voice_value,
-                        parsed["person"],
-                        parsed["number"],
-                        parsed["case"],
-                        parsed["gender"],
-                        parsed["degree"],
-                        verb_form_type_value,
-                        0,
-                        pronoun_type,
-                        governs_case,
-                        json.dumps(tags, ensure_ascii=True),
-                        form_entry.get("source"),
-                    ),
-                )
-
-            inserted += 1
-            if inserted % commit_every == 0:
-                conn.commit()
-
-    conn.commit()
+    try:
+        conn.execute("BEGIN")
+        with open(jsonl_path, "rb", buffering=1 << 20) as handle:
+            results = parse_chunks(iter_chunks(handle, chunk_size), allowed_pos, workers, keep_extra)
+            for parsed, chunk_pos_counts, chunk_reasons in results:
+                for key, count in chunk_reasons.items():
+                    skipped_reasons[key] += count
+                for key, count in chunk_pos_counts.items():
+                    skipped_pos_counts[key] = skipped_pos_counts.get(key, 0) + count
+
+                for pos_code, headword, entry_metadata, senses, forms in parsed:
+                    pos_id = ensure_pos(conn, pos_code, pos_cache)
+                    lemma_id = ensure_lemma(conn, headword, entry_metadata, lemma_cache, last_lemma_meta)
+
+                    lemma_pos_rows.append((lemma_id, pos_id, 1))
+                    for sense in senses:
+                        sense_rows.append((lemma_id, pos_id) + sense)
+                    for form in forms:
+                        dialect_value = form[2]
+                        dialect_id = ensure_dialect(conn, dialect_value, dialect_cache) if dialect_value else None
+                        form_rows.append((lemma_id, pos_id, form[0], form[1], dialect_id) + form[3:])
+
+                    inserted += 1
+                    if inserted % commit_every == 0:
+                        flush_rows(insert_cursors, lemma_pos_rows, sense_rows, form_rows, use_json_each)
+                        conn.execute("COMMIT")
+                        conn.execute("BEGIN")
+                    elif len(sense_rows) >= batch_size or len(form_rows) >= batch_size:
+                        flush_rows(insert_cursors, lemma_pos_rows, sense_rows, form_rows, use_json_each)
+
+        flush_rows(insert_cursors, lemma_pos_rows, sense_rows, form_rows, use_json_each)
+        conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.executescript(SCHEMA_INDEXES_SQL)
+    conn.execute("ANALYZE")
     report_skip_summary(skipped_pos_counts, skipped_reasons)
 
 
@@ -809,23 +936,51 @@ def report_skip_summary(skipped_pos_counts: Dict[str, int], skipped_reasons: Dic
             print(f"{pos_code}: {count}")
 
 
-def create_db_if_missing(db_path: str) -> sqlite3.Connection:
+def apply_bulk_pragmas(conn: sqlite3.Connection, fast: bool = False) -> None:
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute(f"PRAGMA synchronous = {'OFF' if fast else 'NORMAL'}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -262144")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA locking_mode = EXCLUSIVE")
+
+
+def migrate_norms(conn: sqlite3.Connection) -> None:
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= NORM_VERSION:
+        return
+    conn.create_function("normalize", 1, normalize, deterministic=True)
+    conn.execute("BEGIN")
+    try:
+        conn.execute(
+            "UPDATE lemma SET headword_norm = normalize(headword) WHERE headword_norm IS NOT normalize(headword)"
+        )
+        conn.execute("UPDATE form SET form_norm = normalize(form) WHERE form_norm IS NOT normalize(form)")
+        conn.execute(f"PRAGMA user_version = {NORM_VERSION}")
+        conn.execute("COMMIT")
+    except sqlite3.IntegrityError:
+        conn.execute("ROLLBACK")
+        raise SystemExit(
+            "Renormalizing headword_norm produced duplicate lemmas; this DB mixes old and new "
+            "normalization. Rebuild it from scratch."
+        )
+
+
+def create_db_if_missing(db_path: str, fast: bool = False) -> sqlite3.Connection:
     db_dir = os.path.dirname(os.path.abspath(db_path))
     if db_dir and not os.path.exists(db_dir):
         os.makedirs(db_dir, exist_ok=True)
-    new_db = not os.path.exists(db_path)
-    if new_db:
+    if not os.path.exists(db_path):
         open(db_path, "a").close()
-    conn = sqlite3.connect(db_path)
-    if new_db:
-        conn.executescript(SCHEMA_SQL)
-    else:
-        conn.executescript(SCHEMA_SQL)
+    conn = sqlite3.connect(db_path, cached_statements=256, isolation_level=None)
+    apply_bulk_pragmas(conn, fast=fast)
+    conn.executescript(SCHEMA_TABLES_SQL)
     ensure_schema_columns(conn)
+    migrate_norms(conn)
     return conn
 
 
-def parse_pos_list(pos_list: str) -> Set[str]:
+def parse_pos_list(pos_list: str) -> Dict[str, str]:
     result: Set[str] = set()
     for item in pos_list.split(","):
         raw = item.strip().lower()
@@ -833,7 +988,9 @@ def parse_pos_list(pos_list: str) -> Set[str]:
             continue
         mapped = POS_ALIASES.get(raw, raw)
         result.add(mapped)
-    return result
+    allowed_pos = {raw: canon for raw, canon in POS_ALIASES.items() if canon in result}
+    allowed_pos.update((canon, canon) for canon in result)
+    return allowed_pos
 
 
 def main() -> int:
@@ -859,15 +1016,53 @@ def main() -> int:
         default=1000,
         help="Commit every N entries (default: 1000)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=5000,
+        help="Flush buffered sense/form rows every N rows (default: 5000)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for JSON parsing; 1 parses in-process (default: CPU count)",
+    )
+    parser.add_argument(
+        "--insert-mode",
+        choices=("executemany", "json_each"),
+        default="executemany",
+        help="How buffered rows are written: executemany, or one INSERT ... SELECT FROM json_each(?) per batch",
+    )
+    parser.add_argument(
+        "--keep-extra",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Store unmapped entry/sense keys as JSON in entry_extra/sense_extra (default: off)",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Disable fsync during import (PRAGMA synchronous=OFF); a crash may corrupt the DB",
+    )
     args = parser.parse_args()
 
     allowed_pos = parse_pos_list(args.pos)
     if not allowed_pos:
         raise SystemExit("POS set is empty. Provide --pos.")
 
-    conn = create_db_if_missing(args.db)
+    conn = create_db_if_missing(args.db, fast=args.fast)
     try:
-        import_jsonl(conn, args.input, allowed_pos, commit_every=args.commit_every)
+        import_jsonl(
+            conn,
+            args.input,
+            allowed_pos,
+            commit_every=args.commit_every,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            use_json_each=args.insert_mode == "json_each",
+            keep_extra=args.keep_extra,
+        )
     finally:
         conn.close()
     return 0
@@ -41,10 +41,12 @@ def main() -> int:
     db_path = os.path.abspath(args.db)
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, isolation_level=None)
     try:
-        conn.executescript(USER_SCHEMA_SQL)
-        conn.commit()
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.executescript(f"BEGIN;\n{USER_SCHEMA_SQL}\nCOMMIT;")
     finally:
         conn.close()
 